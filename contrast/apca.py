@@ -4,8 +4,8 @@ APCA (Accessible Perceptual Contrast Algorithm) Contrast Implementation
 https://github.com/Myndex/SAPC-APCA
 """
 from __future__ import annotations
+import math
 from coloraide.contrast import ColorContrast
-from coloraide import algebra as alg
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -42,7 +42,8 @@ class APCAContrast(ColorContrast):
     def soft_clamp(self, y: float) -> float:
         """Soft clamp 'y' if near black."""
 
-        return y if y >= self.BLK_THRS else y + (self.BLK_THRS - y) ** self.BLK_CLMP
+        thrs = self.BLK_THRS
+        return y if y >= thrs else y + (thrs - y) ** self.BLK_CLMP
 
     def luminance(self, color: Color) -> float:
         """
@@ -53,7 +54,15 @@ class APCAContrast(ColorContrast):
         """
 
         # return color.luminance()
-        return sum(alg.multiply([alg.spow(c, self.MAIN_TRC) for c in color.convert('srgb')[:-1]], self.GAMMA))
+        # Hex strings and CSS names already live in sRGB, so skip the (comparatively costly) conversion.
+        r, g, b = (color if color.space() == 'srgb' else color.convert('srgb'))[:-1]
+        trc = self.MAIN_TRC
+        kr, kg, kb = self.GAMMA
+        return (
+            kr * math.copysign(abs(r) ** trc, r) +
+            kg * math.copysign(abs(g) ** trc, g) +
+            kb * math.copysign(abs(b) ** trc, b)
+        )
 
     def contrast(self, color1: Color, color2: Color, **kwargs: Any) -> float:
         """
@@ -62,13 +71,17 @@ class APCAContrast(ColorContrast):
         Myndex assumes sRGB according to current publication.
         """
 
-        # Calculate the luminance.
-        lum_txt = self.luminance(color1)
-        lum_bg = self.luminance(color2)
+        return self.contrast_against_precomputed_bg(color1, self.soft_clamp(self.luminance(color2)))
 
-        # Clamp very dark values
-        y_txt = self.soft_clamp(lum_txt)
-        y_bg = self.soft_clamp(lum_bg)
+    def contrast_against_precomputed_bg(self, color1: Color, y_bg: float) -> float:
+        """
+        Contrast of text color against an already soft clamped background luminance.
+
+        Useful when the same background is compared against many text colors.
+        """
+
+        # Calculate the luminance and clamp very dark values
+        y_txt = self.soft_clamp(self.luminance(color1))
 
         # Return Lc = 0 Early for extremely low delta Y.
         # Essentially a noise gate.
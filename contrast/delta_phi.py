@@ -6,7 +6,6 @@ https://github.com/Myndex/deltaphistar
 """
 from __future__ import annotations
 import math
-from coloraide import algebra as alg
 from coloraide.contrast import ColorContrast
 from typing import Any, TYPE_CHECKING
 
@@ -20,17 +19,32 @@ class DeltaPhiStarContrast(ColorContrast):
     NAME = "delta-phi"
 
     PHI = (5 ** 0.5) * 0.5 + 0.5
+    INV_PHI = 1.0 / PHI
     SQRT2 = math.sqrt(2)
 
+    def lstar(self, color: Color) -> float:
+        """Get the CIE L* (Lab D65) of a color, skipping the conversion if already in Lab D65."""
+
+        return (color if color.space() == 'lab-d65' else color.convert('lab-d65', norm=False))[0]
+
     def contrast(self, color1: Color, color2: Color, **kwargs: Any) -> float:
         """Contrast using Delta Phi Star."""
 
-        lstar_txt = color1.get('lab-d65.l')
-        lstar_bg = color2.get('lab-d65.l')
+        return self.contrast_against_precomputed_bg(color1, self.lstar(color2))
+
+    def contrast_against_precomputed_bg(self, color1: Color, lstar_bg: float) -> float:
+        """
+        Contrast of text color against an already known background L*.
+
+        Useful when the same background is compared against many text colors.
+        """
+
+        lstar_txt = self.lstar(color1)
 
+        phi = self.PHI
         contrast = (
-            alg.nth_root(abs(alg.spow(lstar_bg, self.PHI) -
-            alg.spow(lstar_txt, self.PHI)), self.PHI) *
+            abs(math.copysign(abs(lstar_bg) ** phi, lstar_bg) -
+            math.copysign(abs(lstar_txt) ** phi, lstar_txt)) ** self.INV_PHI *
             self.SQRT2 -
             40.0
         )
@@ -6,6 +6,15 @@ achieve specific contrast ratios against background colors.
 """
 from __future__ import annotations
 import math
+from coloraide import algebra as alg
+from coloraide.contrast import ColorContrast
+from coloraide.contrast.lstar import LstarContrast
+from coloraide.contrast.wcag21 import WCAG21Contrast
+from coloraide.spaces.okhsl import toe, toe_inv
+from coloraide.spaces.oklab import OKLAB_TO_LMS3, LMS_TO_XYZD65
+from coloraide.spaces.srgb_linear import XYZ_TO_RGB
+from contrast.apca import APCAContrast
+from contrast.delta_phi import DeltaPhiStarContrast
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -14,6 +23,87 @@ if TYPE_CHECKING:  # pragma: no cover
 # Define a small epsilon for floating point comparisons and adjustments
 EPSILON = 1e-5
 
+# Oklab cone response (LMS) straight to linear sRGB, composed once so the
+# WCAG fast path only needs a single matrix product per candidate
+LMS_TO_SRGBL = alg.matmul(XYZ_TO_RGB, LMS_TO_XYZD65)
+
+
+def _wcag_contrast_kernel(l: float, c: float, cos_h: float, sin_h: float, y_bg: float) -> float:
+    """
+    WCAG 2.1 contrast of an OkLrCh lightness and chroma at a fixed hue against a background luminance.
+
+    Only plain float arithmetic (no `Color` objects or generic algebra calls) so it stays
+    cheap inside the search loop. Returns NaN if the color is outside the sRGB gamut,
+    in which case it must be gamut mapped first.
+    """
+
+    # OkLrCh -> Oklab
+    ok_l = toe_inv(l)
+    a = c * cos_h
+    b = c * sin_h
+
+    # Oklab -> LMS
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = OKLAB_TO_LMS3
+    lms_l = (m00 * ok_l + m01 * a + m02 * b) ** 3
+    lms_m = (m10 * ok_l + m11 * a + m12 * b) ** 3
+    lms_s = (m20 * ok_l + m21 * a + m22 * b) ** 3
+
+    # sRGB gamma is monotonic, so checking linear sRGB is enough for the gamut
+    for r0, r1, r2 in LMS_TO_SRGBL:
+        if not 0.0 <= r0 * lms_l + r1 * lms_m + r2 * lms_s <= 1.0:
+            return math.nan
+
+    # Luminance is the XYZ D65 Y component
+    y0, y1, y2 = LMS_TO_XYZD65[1]
+    y = max(0.0, y0 * lms_l + y1 * lms_m + y2 * lms_s)
+    return (max(y, y_bg) + 0.05) / (min(y, y_bg) + 0.05)
+
+
+def _uses_contrast_of(plugin: ColorContrast | None, base: type[ColorContrast]) -> bool:
+    """
+    Check that `plugin` computes contrast exactly like `base`.
+
+    Subclasses that override `contrast()` have their own formula, so the specialized
+    paths below must not be used for them.
+    """
+
+    return isinstance(plugin, base) and type(plugin).contrast is base.contrast
+
+
+def _precompute_bg(plugin: ColorContrast | None, bg_color: Color) -> float | None:
+    """
+    Calculate the part of a contrast method that only depends on the background.
+
+    Returns `None` if the contrast method is not one we know how to split.
+    """
+
+    if _uses_contrast_of(plugin, WCAG21Contrast):
+        return max(0.0, bg_color.luminance())
+    if _uses_contrast_of(plugin, APCAContrast):
+        return plugin.soft_clamp(plugin.luminance(bg_color))
+    if _uses_contrast_of(plugin, LstarContrast):
+        return bg_color.get('lch-d65.lightness', nans=False)
+    if _uses_contrast_of(plugin, DeltaPhiStarContrast):
+        return plugin.lstar(bg_color)
+    return None
+
+
+def _contrast_against_precomputed_bg(plugin: ColorContrast, color: Color, bg_value: float) -> float:
+    """
+    Contrast of `color` against a background reduced by `_precompute_bg`.
+
+    Only valid for plugins `_precompute_bg` returned a value for.
+    """
+
+    if _uses_contrast_of(plugin, WCAG21Contrast):
+        y = max(0.0, color.luminance())
+        return (max(y, bg_value) + 0.05) / (min(y, bg_value) + 0.05)
+    if _uses_contrast_of(plugin, LstarContrast):
+        return abs(color.get('lch-d65.lightness', nans=False) - bg_value)
+    # APCA and Delta Phi Star provide their own split
+    return plugin.contrast_against_precomputed_bg(color, bg_value)
+
+
 def contrasty(
     self: Color,
     bg: Color | str,
@@ -53,10 +143,12 @@ def contrasty(
         bg_color = bg
 
     # Use OkLrCh for perceptually relevant lightness manipulation
-    # Keep the original color for reference and final conversion
-    original_color = self
+    # Keep the original color space for the final conversion
+    original_space = self.space()
     fg_color = self.convert('oklrch')
-    bg_color = bg_color.convert('oklrch')
+    # Adjusting a color against itself is common, so skip the second conversion
+    # when the background is the very same color.
+    bg_color = fg_color if bg_color == self else bg_color.convert('oklrch')
 
     # Extract initial components
     initial_l = fg_color[0]
@@ -65,6 +157,10 @@ def contrasty(
     alpha = fg_color.alpha() # Preserve alpha
     bg_l = bg_color[0]
 
+    # Whether chroma is scaled proportionally with lightness. This never changes
+    # during the search, so decide it once (and prevent division by zero).
+    scale_chroma = preserve_chroma and initial_l > EPSILON
+
     # Determine target direction (make darker or lighter relative to background)
     # A negative target contrast `cr` means we explicitly want the *opposite*
     # direction adjustment than what would naturally achieve contrast.
@@ -75,118 +171,175 @@ def contrasty(
          # Or perhaps better, return the color that *matches* bg_l if possible.
          # Let's match bg_l, preserving chroma if requested.
         l = bg_l
-        c = initial_c
-        if preserve_chroma and initial_l > EPSILON:
-            c = initial_c * (l / initial_l)
+        c = initial_c * (l / initial_l) if scale_chroma else initial_c
         result = self.__class__('oklrch', [l, c, h], alpha).fit('srgb')
-        return result.convert(original_color.space())
+        return result.convert(original_space)
 
 
     # If cr is negative, flip the intended adjustment direction
     # Otherwise, default is to move away from the background lightness
     explicit_direction = cr < 0
-    natural_make_darker = initial_l > bg_l # Naturally need to go darker for contrast
-    if initial_l == bg_l: # If exactly same lightness, default to darker unless explicit lighter requested
-        natural_make_darker = True
-
-    make_darker = explicit_direction ^ natural_make_darker # XOR logic: flip if explicit requested
-
-    # --- Binary Search Setup ---
-    min_l = 0.0
-    max_l = 1.0
-    current_l = initial_l
-    best_l = current_l # Keep track of the best L found so far
-
-    # Handle starting at the exact same lightness as the background
-    if abs(current_l - bg_l) < EPSILON:
-        # Nudge the starting lightness slightly to establish a search direction
-        current_l += EPSILON if not make_darker else -EPSILON
-        current_l = max(0.0, min(1.0, current_l)) # Clamp to valid range
+    if abs(initial_l - bg_l) < EPSILON:
+        # Same lightness is ambiguous, default to darker unless explicit lighter requested
+        make_darker = not explicit_direction
+    else:
+        # Naturally go darker when lighter than the background, flip if explicit requested
+        make_darker = (initial_l > bg_l) != explicit_direction
 
+    # --- Search Setup ---
     # Search parameters
     # Precision based on typical contrast method sensitivity
     precision = 0.01 if method == 'wcag21' else 0.1 # Looser for APCA/L*/DeltaPhi? Maybe adjust.
     if method == 'apca': precision = 0.5 # APCA values can vary more
     max_iterations = 50
     iterations = 0
-    
-    # Store the closest contrast difference found
-    min_contrast_diff = float('inf')
 
-    # --- Binary Search Loop ---
-    while iterations < max_iterations:
-        iterations += 1
+    # WCAG ratios grow roughly exponentially as lightness approaches black or
+    # white, so interpolate on log(ratio + 1) where the curve is much closer to
+    # linear. The `+ 1` keeps it defined at zero contrast. Precision is mapped
+    # into log space so the tolerance around the target ratio is unchanged.
+    log_space = method == 'wcag21'
+    target_error_base = target_contrast_magnitude
+    if log_space:
+        target_error_base = math.log(target_contrast_magnitude + 1)
+        precision = math.log(target_contrast_magnitude + 1 + precision) - target_error_base
 
-        # Calculate chroma for the current lightness `current_l`
-        current_c = initial_c
-        if preserve_chroma and initial_l > EPSILON:
-            # Scale chroma proportionally, but prevent division by zero
-            current_c = initial_c * (current_l / initial_l)
-
-        # Create the test color, fit it to the sRGB gamut (important!)
-        test_color = self.__class__('oklrch', [current_l, current_c, h], alpha)
-        if not test_color.in_gamut('srgb', tolerance=0):
-             test_color = test_color.fit('srgb')
-             # After fitting, L and C might have changed, update them
-             fitted_oklrch = test_color.convert('oklrch')
-             current_l = fitted_oklrch[0] # Use the *actual* L after fitting
-             current_c = fitted_oklrch[1] # Use the *actual* C after fitting
-
-        # Calculate the contrast for the fitted color
-        current_contrast = test_color.contrast(bg_color, method=method)
-
-        # Check if we met the target contrast magnitude within precision
-        contrast_diff = abs(current_contrast) - target_contrast_magnitude
-        
-        # Update best guess if this is closer
-        if abs(contrast_diff) < min_contrast_diff:
-             min_contrast_diff = abs(contrast_diff)
-             best_l = current_l
+    # The background never changes during the search, so its half of the
+    # contrast calculation (luminance, L*, etc.) only needs to be done once.
+    plugin = self.CONTRAST_MAP.get(method)
+    bg_value = _precompute_bg(plugin, bg_color)
 
-        if abs(contrast_diff) < precision:
-            # Found a satisfactory lightness
-            best_l = current_l
-            break
+    # WCAG 2.1 only needs luminance, and with the hue fixed the OkLrCh -> linear
+    # sRGB chain collapses to the toe inverse, a rotation of chroma into a/b,
+    # and two matrix products. Evaluate that directly instead of walking the
+    # conversion graph; colors needing gamut mapping still go through `fit`.
+    use_wcag_kernel = _uses_contrast_of(plugin, WCAG21Contrast)
+    if use_wcag_kernel:
+        hue = 0.0 if math.isnan(h) else math.radians(h)
+        cos_h = math.cos(hue)
+        sin_h = math.sin(hue)
+
+    # A single scratch test color is updated in place for every candidate
+    # lightness instead of constructing a new Color per evaluation.
+    test_color = self.__class__('oklrch', [0.0, 0.0, h], alpha)
+
+    def contrast_error(l: float) -> float:
+        """Signed distance of the contrast magnitude at lightness `l` from the target."""
+
+        # Calculate chroma for the lightness `l`
+        c = initial_c * (l / initial_l) if scale_chroma else initial_c
+
+        current_contrast = math.nan
+        if use_wcag_kernel:
+            current_contrast = _wcag_contrast_kernel(l, c, cos_h, sin_h, bg_value)
+
+        if math.isnan(current_contrast):
+            # Update the test color, fit it to the sRGB gamut (important!)
+            # Fitting happens in place, so all coordinates are reset every time.
+            test_color[:-1] = [l, c, h]
+            if not test_color.in_gamut('srgb', tolerance=0):
+                test_color.fit('srgb')
+
+            # Calculate the contrast for the fitted color
+            if bg_value is not None:
+                current_contrast = abs(_contrast_against_precomputed_bg(plugin, test_color, bg_value))
+            else:
+                current_contrast = abs(test_color.contrast(bg_color, method=method))
+        if log_space:
+            return math.log(current_contrast + 1) - target_error_base
+        return current_contrast - target_error_base
 
-        # Adjust search range based on the contrast difference and desired direction
-        if contrast_diff < 0:
-            # Current contrast magnitude is TOO LOW. Need to move `current_l` FURTHER from `bg_l`.
-            if make_darker: # We want darker, so need lower L
-                max_l = current_l # Lower L further
-            else: # We want lighter, so need higher L
-                min_l = current_l # Raise L further
+    # Contrast grows monotonically as lightness moves away from `bg_l`, so the
+    # solution is bracketed by the background lightness (near end) and the
+    # extreme, black or white, in the direction we are adjusting (far end).
+    # This is the only place the direction matters; the search below only
+    # looks at the signs of the errors and works the same either way.
+    l_near = bg_l
+    l_far = 0.0 if make_darker else 1.0
+
+    # WCAG 2.1 can be inverted analytically: (Y_hi + 0.05) / (Y_lo + 0.05) = cr
+    # gives the luminance we need, and for a neutral color Oklab lightness is
+    # simply the cube root of luminance. Chroma shifts luminance a bit, so this
+    # is only a first guess, but it often lands within precision straight away.
+    l_guess = None
+    if use_wcag_kernel:
+        if make_darker:
+            y_target = (bg_value + 0.05) / target_contrast_magnitude - 0.05
         else:
-            # Current contrast magnitude is TOO HIGH. Need to move `current_l` CLOSER to `bg_l`.
-            if make_darker: # We want darker, current L is too low
-                min_l = current_l # Raise L towards bg_l
-            else: # We want lighter, current L is too high
-                max_l = current_l # Lower L towards bg_l
-
-        # Calculate the midpoint for the next iteration
-        next_l = (min_l + max_l) / 2
-
-        # Avoid getting stuck if search space collapses
-        if abs(next_l - current_l) < EPSILON:
-             # Try nudging slightly based on direction
-             nudge = EPSILON * (1 if max_l > min_l else -1) # Small nudge
-             current_l += nudge
-             if current_l < min_l or current_l > max_l: # If nudge failed, break
-                 break
+            y_target = (bg_value + 0.05) * target_contrast_magnitude - 0.05
+        if 0.0 < y_target < 1.0:
+            l_guess = toe(alg.nth_root(y_target, 3))
+            f_guess = contrast_error(l_guess)
+
+    if l_guess is not None and abs(f_guess) < precision:
+        # The first guess is good enough, no need to bracket the solution
+        best_l, min_contrast_diff = l_guess, abs(f_guess)
+        max_iterations = 0
+    else:
+        f_near = contrast_error(l_near)
+        f_far = contrast_error(l_far)
+
+        # Keep track of the best L found so far
+        if abs(f_near) < abs(f_far):
+            best_l, min_contrast_diff = l_near, abs(f_near)
         else:
-             current_l = next_l
+            best_l, min_contrast_diff = l_far, abs(f_far)
+
+        if (f_near < 0) == (f_far < 0):
+            # No sign change: the target is unreachable in this direction (or already
+            # met at the background lightness). Fall back to the original color if
+            # it already meets the target or is closer than the extreme. The
+            # background lightness itself is never a useful answer.
+            best_l, min_contrast_diff = l_far, abs(f_far)
+            initial_diff = contrast_error(initial_l)
+            if initial_diff > -precision or abs(initial_diff) < min_contrast_diff:
+                best_l, min_contrast_diff = initial_l, abs(initial_diff)
+            max_iterations = 0
+        elif l_guess is not None and min(l_near, l_far) < l_guess < max(l_near, l_far):
+            # Tighten the bracket with the first guess
+            if (f_guess < 0) == (f_near < 0):
+                l_near, f_near = l_guess, f_guess
+            else:
+                l_far, f_far = l_guess, f_guess
+
+    # --- Illinois (Regula Falsi) Loop ---
+    # Contrast is smooth in lightness, so interpolating the root converges in far
+    # fewer contrast evaluations than bisection. Halving the error of an endpoint
+    # that is retained twice in a row (Illinois) prevents one-sided stagnation.
+    retained = 0
+    while iterations < max_iterations and min_contrast_diff >= precision:
+        iterations += 1
 
-        # Safety break if range is invalid
-        if min_l > max_l:
+        # The bracket has collapsed, no lightness left to try can do better
+        if abs(l_far - l_near) < EPSILON:
             break
 
+        next_l = l_far - f_far * (l_far - l_near) / (f_far - f_near)
+        contrast_diff = contrast_error(next_l)
+
+        # Update best guess if this is closer
+        if abs(contrast_diff) < min_contrast_diff:
+             min_contrast_diff = abs(contrast_diff)
+             best_l = next_l
+
+        # Replace the endpoint that shares the sign of the new error
+        if (contrast_diff < 0) == (f_far < 0):
+            l_far, f_far = next_l, contrast_diff
+            if retained < 0:
+                f_near /= 2
+            retained = -1
+        else:
+            l_near, f_near = next_l, contrast_diff
+            if retained > 0:
+                f_far /= 2
+            retained = 1
+
     # --- Result Generation ---
     # Use the best lightness found during the search
     final_l = best_l
 
     # Calculate final chroma
-    final_c = initial_c
-    if preserve_chroma and initial_l > EPSILON:
-        final_c = initial_c * (final_l / initial_l)
+    final_c = initial_c * (final_l / initial_l) if scale_chroma else initial_c
 
     # Create the final color object
     result_color = self.__class__('oklrch', [final_l, final_c, h], alpha)
@@ -196,4 +349,4 @@ def contrasty(
         result_color = result_color.fit('srgb')
 
     # Convert back to the original color space and return
-    return result_color.convert(original_color.space())
+    return result_color.convert(original_space)
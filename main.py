@@ -96,6 +96,15 @@ if __name__ == "__main__":
     print(f"Delta Phi lighter: {delta_phi_lighter.to_string(hex=True)}")
     print(f"Delta Phi contrast: {delta_phi_lighter.contrast('black', method='delta-phi')}")
     
+    # Already past the target: the original color should be returned unchanged
+    white_on_black = Color("white").contrasty("black", 4.5)
+    black_on_white = Color("black").contrasty("white", 4.5)
+
+    print(f"\nWhite on black: {white_on_black.to_string(hex=True)}")
+    print(f"Contrast ratio: {white_on_black.contrast('black')}")
+    print(f"Black on white: {black_on_white.to_string(hex=True)}")
+    print(f"Contrast ratio: {black_on_white.contrast('white')}")
+
     # Compare different contrast methods on the same color
     sample = Color("hsl", [120, 80, 50])  # A vivid green
     print(f"\nOriginal sample: {sample.to_string()}")